@@ -2,19 +2,64 @@
 
 from pathlib import Path
 from pprint import pprint
-from typing import Dict, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from ortools.linear_solver import pywraplp
-from plotly.graph_objs import Figure
+from ortools.linear_solver import linear_solver_pb2, pywraplp
+
+if TYPE_CHECKING:
+    from plotly.graph_objs import Figure
+
+
+def _supply_statistics(coefficients: np.ndarray, solution: np.ndarray):
+    captures = coefficients * solution[None, :]
+    return captures, captures.sum(axis=1), captures.sum(axis=0)
+
+
+# Replaced by numba.prange before _supply_statistics_loops is compiled
+_prange = range
+# Compiled kernel, None before the first attempt to load Numba and False if Numba is not installed
+_supply_statistics_jit = None
+
+
+def _supply_statistics_loops(coefficients, solution):
+    n_supplies, n_consumers = coefficients.shape
+    captures = np.empty((n_supplies, n_consumers))
+    used = np.empty(n_supplies)
+    for supply_i in _prange(n_supplies):
+        supply_used = 0.0
+        for consumer_i in range(n_consumers):
+            capture = coefficients[supply_i, consumer_i] * solution[consumer_i]
+            captures[supply_i, consumer_i] = capture
+            supply_used += capture
+        used[supply_i] = supply_used
+    return captures, used, captures.sum(axis=0)
+
+
+def _load_supply_statistics_jit():
+    global _prange, _supply_statistics_jit
+    if _supply_statistics_jit is None:
+        try:
+            from numba import njit, prange as _prange
+        except ImportError:
+            _supply_statistics_jit = False
+        else:
+            _supply_statistics_jit = njit(cache=True, parallel=True)(_supply_statistics_loops)
+    return _supply_statistics_jit or None
 
 
 class Ecosystem:
+    # Number of nonzero demand entries above which the first-order PDLP solver is used instead of the simplex-based
+    # GLOP solver
+    pdlp_min_demand_entries = 1_000_000
+    # Number of constraint coefficients above which supply statistics are computed with Numba, if it is installed
+    numba_min_coefficients = 100_000
+
     def __init__(self,
                  market_def: Dict,
                  supply_def: Dict,
-                 demand_def: Dict):
+                 demand_def: Union[Dict, np.ndarray]):
         self.market_penetration = None
         self.market_penetration_by_consumer = None
         self.market_size = None
@@ -22,18 +67,87 @@ class Ecosystem:
         self.market_captures_by_consumer = None
 
         self.supply_size = None
-        self.supply_captures_by_supply_and_consumer = None
+        self._supply_captures = None
+        self._supply_captures_by_supply_and_consumer = None
         self.supply_utilization_by_supply = None
         self.supply_utilization = None
         self.supply_utilization_by_consumer = None
 
         self.consumers = None
+        self._objective_value = None
+        self._constraint_names = None
+        self._coefficients = None
+        self._constraint_qty = None
+        self._active_supply_total = None
+        self._unused_total = None
+        self._built = False
+        self._sorted_consumers = None
+        self._sorted_supplies = None
+        self._sorted_supply_utilization_by_consumer = None
 
         self.market_def = market_def
         self.supply_def = supply_def
-        self.demand_def = demand_def
-
-        self.solver = pywraplp.Solver.CreateSolver('SCIP')
+        # Demand coefficients as a dense matrix with one row per supply and one column per consumer. If the demand is
+        # given as such a matrix already, the demand dictionary is only built when it is accessed or when consumers or
+        # supplies change. From then on, the matrix is rebuilt from that dictionary like for any other ecosystem.
+        if isinstance(demand_def, np.ndarray):
+            self._demand_def = None
+            self._A = demand_def
+        else:
+            self._demand_def = demand_def
+            self._A = None
+        self._load_definition()
+
+        # Created on the first call to solve()
+        self.solver = None
+
+    def _load_definition(self):
+        self._consumer_names = tuple(self.market_def)
+        self._supply_names = tuple(self.supply_def)
+        self._consumer_idx = {consumer_name: i for i, consumer_name in enumerate(self._consumer_names)}
+        self._supply_idx = {supply_name: i for i, supply_name in enumerate(self._supply_names)}
+        self._test()
+
+        if self._demand_def is None:
+            demand_shape = (len(self._supply_names), len(self._consumer_names))
+            if self._A.shape != demand_shape:
+                raise ValueError(f'The demand matrix needs to have shape {demand_shape} (supplies x consumers), '
+                                 f'but has shape {self._A.shape}.')
+            self._demanded_suppliers = set(self._supply_names)
+        else:
+            self._A = np.zeros((len(self._supply_names), len(self._consumer_names)))
+            for consumer_name, consumer_demand in self._demand_def.items():
+                consumer_i = self._consumer_idx[consumer_name]
+                for supply_name, coefficient in consumer_demand.items():
+                    self._A[self._supply_idx[supply_name], consumer_i] = coefficient
+            self._demanded_suppliers = set().union(*(demands.keys() for demands in self._demand_def.values()))
+
+    @property
+    def demand_def(self) -> Dict:
+        if self._demand_def is None:
+            self._demand_def = {consumer_name: dict(zip(self._supply_names, consumer_demand))
+                                for consumer_name, consumer_demand in zip(self._consumer_names, self._A.T.tolist())}
+        return self._demand_def
+
+    @property
+    def supply_captures_by_supply_and_consumer(self) -> Optional[Dict]:
+        if self._supply_captures_by_supply_and_consumer is None and self._supply_captures is not None:
+            captures, unused = self._supply_captures
+            self._supply_captures_by_supply_and_consumer = {}
+            for constraint_name, supply_captures, supply_unused in zip(self._constraint_names, captures.tolist(),
+                                                                       unused.tolist()):
+                self._supply_captures_by_supply_and_consumer[constraint_name] = \
+                    dict(zip(self._consumer_names, supply_captures))
+                self._supply_captures_by_supply_and_consumer[constraint_name]['unused'] = supply_unused
+        return self._supply_captures_by_supply_and_consumer
+
+    def _create_solver(self):
+        if np.count_nonzero(self._A) >= self.pdlp_min_demand_entries:
+            solver = pywraplp.Solver.CreateSolver('PDLP')
+            solver.SetSolverSpecificParametersAsString(
+                'termination_criteria { simple_optimality_criteria { eps_optimal_relative: 1e-6 } }')
+            return solver
+        return pywraplp.Solver.CreateSolver('GLOP')
 
     @staticmethod
     def from_dict(dict_: Dict):
@@ -45,38 +159,52 @@ class Ecosystem:
         except KeyError:
             raise KeyError(f'If you create an Ecosystem from a dictionary, that dictionary needs to include the keys '
                            '"market", "demand" and "supply". The dictionary you supplied contains the following keys: '
-                           '{}. Please fix the dictionary and try again.'.format(', '.join(list(dict.keys()))))
+                           '{}. Please fix the dictionary and try again.'.format(', '.join(dict_.keys())))
+
+    @staticmethod
+    def from_arrays(market_vec: np.ndarray,
+                    demand_mat: np.ndarray,
+                    supply_vec: np.ndarray,
+                    consumer_names: List[str],
+                    supply_names: List[str]):
+        return Ecosystem(
+            market_def=dict(zip(consumer_names, market_vec.tolist())),
+            supply_def=dict(zip(supply_names, supply_vec.tolist())),
+            demand_def=demand_mat)
 
     @staticmethod
     def from_csv(path: Union[str, Path]):
         data = pd.read_csv(path, index_col=0)
 
-        ecosystem_definition = {}
-        ecosystem_definition['market'] = data.iloc[-1, :-1].astype(int).to_dict()
-        ecosystem_definition['demand'] = data.iloc[:-1, :-1].to_dict()
-        ecosystem_definition['supply'] = data.iloc[:-1, -1].astype(int).to_dict()
-
-        return Ecosystem.from_dict(ecosystem_definition)
-
-    def _test_suppliers_exist(self):
-        for consumer_name, consumer_demand in self.demand_def.items():
-            for supplier_name in consumer_demand.keys():
-                assert supplier_name in self.supply_def, \
-                    f'{supplier_name} is demanded by {consumer_name}, but it is not in supplier definition'
-
-    def _test_supplier_geq_zero(self):
-        for supplier_name, supplier_qty in self.supply_def.items():
-            assert supplier_qty >= 0, f'Supplied quantity of {supplier_name} needs to be >= 0, but is {supplier_qty}'
-
-    def _test_consumers_in_market(self):
-        for consumer_name in self.demand_def.keys():
-            assert consumer_name in self.market_def, f'{consumer_name} is in the demand definition, but not in the ' \
-                                                     f'market definition.'
+        return Ecosystem.from_arrays(
+            market_vec=data.iloc[-1, :-1].to_numpy(dtype=np.int64),
+            demand_mat=data.iloc[:-1, :-1].to_numpy(),
+            supply_vec=data.iloc[:-1, -1].to_numpy(dtype=np.int64),
+            consumer_names=data.columns[:-1].tolist(),
+            supply_names=data.index[:-1].tolist())
 
     def _test(self):
-        self._test_suppliers_exist()
-        self._test_supplier_geq_zero()
-        self._test_consumers_in_market()
+        # A demand matrix is aligned with the supply and market definitions by construction, so only demand
+        # dictionaries need their names checked.
+        if self._demand_def is not None:
+            for consumer_name, consumer_demand in self._demand_def.items():
+                unknown_suppliers = consumer_demand.keys() - self.supply_def.keys()
+                if unknown_suppliers:
+                    raise AssertionError(f'{unknown_suppliers.pop()} is demanded by {consumer_name}, but it is not in '
+                                         f'supplier definition')
+
+        negative_suppliers = [supplier_name for supplier_name, supplier_qty in self.supply_def.items()
+                              if supplier_qty < 0]
+        if negative_suppliers:
+            supplier_name = negative_suppliers[0]
+            raise AssertionError(f'Supplied quantity of {supplier_name} needs to be >= 0, but is '
+                                 f'{self.supply_def[supplier_name]}')
+
+        if self._demand_def is not None:
+            unknown_consumers = self._demand_def.keys() - self.market_def.keys()
+            if unknown_consumers:
+                raise AssertionError(f'{unknown_consumers.pop()} is in the demand definition, but not in the market '
+                                     f'definition.')
 
     def print_definition(self):
         print('-- Market --')
@@ -86,73 +214,138 @@ class Ecosystem:
         print('-- Demand --')
         pprint(self.demand_def)
 
-    def solve(self,
-              print_solution: bool = True):
-        self.consumers = {}
-        for consumer_name, consumer_qty in self.market_def.items():
-            self.consumers[consumer_name] = self.solver.IntVar(0, consumer_qty, consumer_name)
-
-        def check_supplier_in_demands(supplier_name):
-            supplier_in_demands = []
-            for demands in self.demand_def.values():
-                supplier_in_demands.append(supplier_name in demands)
-            return any(supplier_in_demands)
-
-        constraints = {}
-        for supply_name, supply_qty in self.supply_def.items():
-            if check_supplier_in_demands(supply_name):
-                constraint = self.solver.RowConstraint(0, supply_qty, supply_name)
-                constraints[supply_name] = constraint
-                for consumer_name, consumer in self.consumers.items():
-                    constraint.SetCoefficient(consumer, self.demand_def[consumer_name][supply_name])
-
-        objective = self.solver.Objective()
-        for consumer in self.consumers.values():
-            objective.SetCoefficient(consumer, 1)
-        objective.SetMaximization()
+    def _set_constraint_qty(self):
+        self._constraint_qty = np.array([self.supply_def[supply_name] for supply_name in self._constraint_names],
+                                        dtype=float)
+        self._active_supply_total = self._constraint_qty.sum()
+
+    def _demanded_constraint_names(self) -> List[str]:
+        return [supply_name for supply_name in self._supply_names if supply_name in self._demanded_suppliers]
+
+    def _constraint_coefficients(self) -> np.ndarray:
+        return self._A[[self._supply_idx[supply_name] for supply_name in self._constraint_names]]
+
+    def _build_model(self):
+        model = linear_solver_pb2.MPModelProto()
+        model.maximize = True
+        for consumer_name in self._consumer_names:
+            model.variable.add(name=consumer_name,
+                               lower_bound=0,
+                               upper_bound=self.market_def[consumer_name],
+                               objective_coefficient=1,
+                               is_integer=False)
+
+        self._constraint_names = self._demanded_constraint_names()
+        self._coefficients = self._constraint_coefficients()
+        self._set_constraint_qty()
+        for supply_name, supply_qty, supply_coefficients in zip(self._constraint_names, self._constraint_qty.tolist(),
+                                                                self._coefficients):
+            # Only consumers that actually demand the supply enter the constraint
+            demanding_consumers = np.flatnonzero(supply_coefficients)
+            model.constraint.add(name=supply_name,
+                                 lower_bound=0,
+                                 upper_bound=supply_qty,
+                                 var_index=demanding_consumers.tolist(),
+                                 coefficient=supply_coefficients[demanding_consumers].tolist())
+
+        load_error = self.solver.LoadModelFromProto(model)
+        if load_error:
+            raise RuntimeError(f'The ecosystem could not be loaded into the solver: {load_error}')
+        self.consumers = dict(zip(self._consumer_names, self.solver.variables()))
+
+    def _update_model(self):
+        coefficients = self._constraint_coefficients()
+        constraints = self.solver.constraints()
+        variables = self.solver.variables()
+        for supply_i, consumer_i in zip(*np.nonzero(coefficients != self._coefficients)):
+            constraints[supply_i].SetCoefficient(variables[consumer_i], float(coefficients[supply_i, consumer_i]))
+        self._coefficients = coefficients
+
+        for consumer_name, consumer in self.consumers.items():
+            consumer.SetBounds(0, self.market_def[consumer_name])
+        self._set_constraint_qty()
+        for supply_qty, constraint in zip(self._constraint_qty.tolist(), constraints):
+            constraint.SetBounds(0, supply_qty)
+        # GLOP and PDLP ignore hints and re-optimize from the loaded model; the hint only helps MIP backends
+        self.solver.SetHint(list(self.consumers.values()), list(self.market_captures_by_consumer.values()))
 
+    def solve(self,
+              print_solution: bool = True,
+              warm_start: bool = True):
+        """Solve the ecosystem for maximum market penetration.
+
+        With `warm_start`, repeated calls keep the model of the previous call in the solver and only update the
+        quantities and demand coefficients, so that the solver can continue from the previous solution. If consumers or
+        supplies were added or removed since the last call, the model is rebuilt.
+        """
+        if self.solver is None:
+            self.solver = self._create_solver()
+
+        structure_changed = (tuple(self.market_def) != self._consumer_names
+                             or tuple(self.supply_def) != self._supply_names)
+        if structure_changed and self._demand_def is None:
+            # The demand matrix is laid out for the previous names, so continue from its dictionary form
+            self.demand_def
+        if self._demand_def is not None:
+            # Picks up changes to the demand dictionary and to the consumer and supply names
+            self._load_definition()
+
+        if warm_start and self._built and not structure_changed \
+                and self._demanded_constraint_names() == self._constraint_names:
+            self._update_model()
+        else:
+            self._build_model()
         status = self.solver.Solve()
         if status != pywraplp.Solver.OPTIMAL:
+            # Without an optimal solution there is nothing to warm-start from, so the next call rebuilds the model
+            self._built = False
             raise RuntimeError('The problem does not have an optimal solution.')
+        self._built = True
+
+        self._objective_value = self.solver.Objective().Value()
+        solution = np.array([consumer.solution_value() for consumer in self.consumers.values()])
+        solution_by_consumer = dict(zip(self._consumer_names, solution.tolist()))
 
-        self.market_size = sum(self.market_def.values())
-        self.market_penetration = self.solver.Objective().Value() / self.market_size
+        # Totals are taken over the same consumers and supplies as the model
+        self.market_size_by_consumer = {consumer_name: self.market_def[consumer_name]
+                                        for consumer_name in self._consumer_names}
+        self.market_size = sum(self.market_size_by_consumer.values())
+        self.market_penetration = self._objective_value / self.market_size
 
-        self.market_size_by_consumer = self.market_def
-        self.market_captures_by_consumer = {consumer_name: consumer.solution_value() for consumer_name, consumer in
-                                            self.consumers.items()}
+        self.market_captures_by_consumer = solution_by_consumer
         self.market_penetration_by_consumer = \
-            {consumer_name: consumer.solution_value() / self.market_size_by_consumer[consumer_name]
-             for consumer_name, consumer in self.consumers.items()}
-
-        self.supply_size = sum(self.supply_def.values())
-        self.supply_captures_by_supply_and_consumer = {}
-        self.supply_utilization_by_supply = {}
-
-        for constraint_name, constraint in constraints.items():
-            captures_by_consumer = {consumer_name: constraint.GetCoefficient(consumer) * consumer.solution_value() for
-                                    consumer_name, consumer in self.consumers.items()}
-            self.supply_captures_by_supply_and_consumer[constraint_name] = captures_by_consumer
-            self.supply_captures_by_supply_and_consumer[constraint_name]['unused'] = \
-                self.supply_def[constraint_name] \
-                - sum(self.supply_captures_by_supply_and_consumer[constraint_name].values())
-
-            self.supply_utilization_by_supply[constraint_name] = \
-                (sum(self.supply_captures_by_supply_and_consumer[constraint_name].values())
-                 - self.supply_captures_by_supply_and_consumer[constraint_name]['unused']) \
-                / sum(self.supply_captures_by_supply_and_consumer[constraint_name].values())
+            {consumer_name: consumer_solution / self.market_size_by_consumer[consumer_name]
+             for consumer_name, consumer_solution in solution_by_consumer.items()}
+
+        self.supply_size = sum(self.supply_def[supply_name] for supply_name in self._supply_names)
+
+        supply_statistics = _supply_statistics
+        if self._coefficients.size >= self.numba_min_coefficients:
+            supply_statistics = _load_supply_statistics_jit() or _supply_statistics
+        captures, used, captures_by_consumer = supply_statistics(self._coefficients, solution)
+        unused = self._constraint_qty - used
+        self._unused_total = unused.sum()
+        self._supply_captures = (captures, unused)
+        self._supply_captures_by_supply_and_consumer = None
+
+        utilization = np.divide(used, self._constraint_qty, out=np.zeros_like(used), where=self._constraint_qty > 0)
+        self.supply_utilization_by_supply = dict(zip(self._constraint_names, utilization.tolist()))
         self.supply_utilization = \
-            1 - sum([supply_captures['unused']
-                     for supply_name, supply_captures in self.supply_captures_by_supply_and_consumer.items()])\
-            / sum([self.supply_def[supply_name] for supply_name in self.supply_captures_by_supply_and_consumer.keys()])
-
-        self.supply_utilization_by_consumer = {}
-        for consumer_name in self.consumers.keys():
-            self.supply_utilization_by_consumer[consumer_name] = \
-                sum([self.supply_captures_by_supply_and_consumer[supply_name][consumer_name]
-                     for supply_name in self.supply_captures_by_supply_and_consumer.keys()]) \
-                / self.supply_size
-        self.supply_utilization_by_consumer['unused'] = 1 - sum(self.supply_utilization_by_consumer.values())
+            float(1 - self._unused_total / self._active_supply_total) if self._active_supply_total > 0 else 0.0
+
+        if self.supply_size > 0:
+            utilization_by_consumer = captures_by_consumer / self.supply_size
+            unused_utilization = float(1 - utilization_by_consumer.sum())
+        else:
+            utilization_by_consumer = np.zeros_like(captures_by_consumer)
+            unused_utilization = 0.0
+        self.supply_utilization_by_consumer = dict(zip(self._consumer_names, utilization_by_consumer.tolist()))
+        self.supply_utilization_by_consumer['unused'] = unused_utilization
+
+        # Reporting order for print_solution
+        self._sorted_consumers = sorted(self.market_penetration_by_consumer)
+        self._sorted_supplies = sorted(self.supply_utilization_by_supply.items())
+        self._sorted_supply_utilization_by_consumer = sorted(self.supply_utilization_by_consumer.items())
 
         if print_solution:
             self.print_solution()
@@ -160,75 +353,61 @@ class Ecosystem:
     def print_solution(self):
         print('-- SOLUTION ––')
 
-        print('Market penetration: {:.1%} ({:.0f}/{:.0f})'.format(
-            self.market_penetration,
-            self.solver.Objective().Value(),
-            self.market_size))
+        print(f'Market penetration: {self.market_penetration:.1%} ({self._objective_value:.0f}/{self.market_size:.0f})')
 
         print('By consumer:')
-        for consumer_name in sorted(self.market_penetration_by_consumer):
-            print(' - {}: {:.1%} ({:.0f}/{:.0f})'.format(
-                consumer_name.title(),
-                self.market_penetration_by_consumer[consumer_name],
-                self.consumers[consumer_name].solution_value(),
-                self.market_size_by_consumer[consumer_name]
-            ))
+        for consumer_name in self._sorted_consumers:
+            print(f' - {consumer_name.title()}: {self.market_penetration_by_consumer[consumer_name]:.1%} '
+                  f'({self.market_captures_by_consumer[consumer_name]:.0f}/'
+                  f'{self.market_size_by_consumer[consumer_name]:.0f})')
         print()
-        print('Supply utilization: {:.1%} ({:.0f}/{:.0f})'.format(
-            self.supply_utilization,
-            self.supply_utilization * self.supply_size,
-            self.supply_size
-        ))
+        print(f'Supply utilization: {self.supply_utilization:.1%} '
+              f'({self.supply_utilization * self.supply_size:.0f}/{self.supply_size:.0f})')
         print('By supply:')
-        for supply_name, utilization in sorted(self.supply_utilization_by_supply.items()):
-            print(' - {}: {:.1%} ({:.0f}/{:.0f})'.format(
-                supply_name.title(),
-                utilization,
-                utilization * self.supply_def[supply_name],
-                self.supply_def[supply_name]))
+        for supply_name, utilization in self._sorted_supplies:
+            supply_qty = self.supply_def[supply_name]
+            print(f' - {supply_name.title()}: {utilization:.1%} ({utilization * supply_qty:.0f}/{supply_qty:.0f})')
         print('By consumer:')
-        for consumer_name, utilization in sorted(self.supply_utilization_by_consumer.items()):
-            print(' - {}: {:.1%}'.format(
-                consumer_name.title(),
-                utilization))
-
-    def plot_market_penetration(self) -> Figure:
-        data = pd.Series(self.market_penetration_by_consumer).sort_values()
-        data['overall'] = self.market_penetration
-        data.index = [v.title() for v in data.index]
-        fig = px.bar(data,
-                     text=['{:.1%}'.format(v) for v in data.values],
-                     orientation='h',
-                     labels={'index': 'Consumer', 'value': 'Market Penetration'},
-                     title='Market Penetration by Consumer')
-        fig.update_layout(xaxis=dict(tickformat='%', range=[0, 1]), showlegend=False)
+        for consumer_name, utilization in self._sorted_supply_utilization_by_consumer:
+            print(f' - {consumer_name.title()}: {utilization:.1%}')
+
+    @staticmethod
+    def _plot_bar(values_by_name: Dict,
+                  index_label: str,
+                  value_label: str,
+                  overall: Optional[float] = None) -> 'Figure':
+        import plotly.graph_objects as go
+
+        names = np.array([name.title() for name in values_by_name])
+        values = np.fromiter(values_by_name.values(), float, count=len(values_by_name))
+        # Bars with equal values keep the order of values_by_name
+        order = np.argsort(values, kind='stable')
+        names, values = names[order], values[order]
+        if overall is not None:
+            names = np.append(names, 'Overall')
+            values = np.append(values, overall)
+
+        fig = go.Figure(go.Bar(x=values,
+                               y=names,
+                               text=[f'{v:.1%}' for v in values],
+                               orientation='h'))
+        fig.update_layout(title=f'{value_label} by {index_label}',
+                          xaxis=dict(title=value_label, tickformat='%', range=[0, 1]),
+                          yaxis=dict(title=index_label),
+                          showlegend=False)
         fig.show()
         return fig
 
-    def plot_supply_utilization(self, by: str = 'supply'):
+    def plot_market_penetration(self) -> 'Figure':
+        return self._plot_bar(self.market_penetration_by_consumer, 'Consumer', 'Market Penetration',
+                              overall=self.market_penetration)
+
+    def plot_supply_utilization(self, by: str = 'supply') -> 'Figure':
         if by == 'supply':
-            data = pd.Series(self.supply_utilization_by_supply).sort_values()
-            data['overall'] = self.supply_utilization
-            data.index = [v.title() for v in data.index]
-            fig = px.bar(data,
-                         text=['{:.1%}'.format(v) for v in data.values],
-                         orientation='h',
-                         labels={'index': 'Supply', 'value': 'Supply Utilization'},
-                         title='Supply Utilization by Supply')
+            return self._plot_bar(self.supply_utilization_by_supply, 'Supply', 'Supply Utilization',
+                                  overall=self.supply_utilization)
         elif by == 'consumer':
-            data = pd.Series(self.supply_utilization_by_consumer).sort_values()
-            data.index = [v.title() for v in data.index]
-            fig = px.bar(data,
-                         text=['{:.1%}'.format(v) for v in data.values],
-                         orientation='h',
-                         labels={'index': 'Consumer', 'value': 'Supply Utilization'},
-                         title='Supply Utilization by Consumer')
-            fig.update_layout(xaxis=dict(tickformat='%', range=[0, 1]), showlegend=False)
-            fig.show()
-            return fig
+            return self._plot_bar(self.supply_utilization_by_consumer, 'Consumer', 'Supply Utilization')
         else:
             raise KeyError('Argument `by` needs to be either "supply" or "consumer". '
                            'You provided value "{}"'.format(by))
-        fig.update_layout(xaxis=dict(tickformat='%', range=[0, 1]), showlegend=False)
-        fig.show()
-        return fig